@@ -15,12 +15,17 @@ sys.path.insert(0, '/root/iceland_secp256k1')
 import secp256k1 as ice
 import time
 import os
+from itertools import repeat
 
 # ─── Configuration ───────────────────────────────────────────────────────────
 TARGET_H160 = bytes.fromhex("f6f5431d25bbf7b12e8add9af5e3475c44a0a5b8")
 RANGE_START = 0x400000000000000000
 RANGE_END   = 0x7FFFFFFFFFFFFFFFFF
-NUM_CPUS    = os.cpu_count() or 4
+try:
+    # CPUs this process may actually run on (cgroup/taskset aware)
+    NUM_CPUS = len(os.sched_getaffinity(0))
+except AttributeError:
+    NUM_CPUS = os.cpu_count() or 4
 
 # Test private key in the puzzle range
 TEST_PK = RANGE_START + 123456789
@@ -49,11 +54,12 @@ def benchmark(name, func, iterations, keys_per_call=1):
         print(f"  [{name}] FAILED during warmup: {e}")
         return None
 
-    # Timed run
-    start = time.perf_counter()
-    for _ in range(iterations):
-        func()
-    elapsed = time.perf_counter() - start
+    # Timed run (repeat() avoids boxing a fresh int per iteration)
+    f = func
+    start = time.perf_counter_ns()
+    for _ in repeat(None, iterations):
+        f()
+    elapsed = (time.perf_counter_ns() - start) / 1e9
 
     total_keys = iterations * keys_per_call
     keys_sec = total_keys / elapsed
@@ -63,6 +69,10 @@ def benchmark(name, func, iterations, keys_per_call=1):
     print()
     return keys_sec
 
+def compress_point(pt, off=0):
+    """33-byte compressed pubkey from the 65-byte point at pt[off:], no hex round-trip."""
+    return bytes((2 | (pt[off + 64] & 1),)) + pt[off + 1:off + 33]
+
 def divider(title):
     print()
     print(f"{'='*70}")
@@ -186,7 +196,10 @@ for batch_sz in [10_000, 100_000, 500_000, 1_000_000]:
 
 # 4e. point_sequential_increment_P2X_mcpu (multi-core X-coordinate only — 32 bytes each)
 print("  NOTE: P2X variant returns only X-coordinates (32 bytes each vs 65).")
-print("  Less data but may need extra work for h160 computation.")
+print("  If P2X is close to 2x P2 (4d) here, generation is memory-bound")
+print("  (P2X writes ~half the bytes); if it is close to 1x, it is compute-bound.")
+print("  It cannot feed h160 directly: a compressed pubkey also needs Y parity")
+print("  (one sqrt per point without it), so this is a points-only upper bound.")
 print()
 for batch_sz in [10_000, 100_000, 500_000, 1_000_000]:
     iters = max(3, 1_000_000 // batch_sz)
@@ -219,8 +232,7 @@ divider("6. HASHING FUNCTIONS (SHA256, RIPEMD160, Hash160)")
 # ─────────────────────────────────────────────────────────────────────────────
 
 # Compressed pubkey for hashing tests
-cpub_str = ice.point_to_cpub(BASE_POINT)
-cpub_bytes = bytes.fromhex(cpub_str)
+cpub_bytes = compress_point(BASE_POINT)
 
 # 6a. hash160 (SHA256 + RIPEMD160)
 N = 500_000
@@ -254,6 +266,21 @@ r = benchmark("point_to_cpub(65-byte point)",
     lambda: ice.point_to_cpub(BASE_POINT), N)
 if r: results['point_to_cpub'] = r
 
+# 6f. Per-call hash160 over distinct pubkeys (one 33*K buffer)
+# Same call as 6a, but over K different inputs rather than one.
+# Each key still pays a Python call and a 33-byte slice, and the 3.3 MB
+# buffer sits in L3, so this is interpreter-bound. It says nothing about
+# ALU- vs bandwidth-bound hashing; that needs a batched entry point.
+K = 100_000
+distinct_pts = ice.point_sequential_increment(K, BASE_POINT)
+cpub_buf = b''.join(compress_point(distinct_pts, o) for o in range(0, K * 65, 65))
+def hash160_distinct():
+    h = ice.hash160
+    for off in range(0, K * 33, 33):
+        h(cpub_buf[off:off + 33])
+r = benchmark(f"hash160 per-call({K:,} distinct pubkeys)", hash160_distinct, 5, K)
+if r: results['hash160_distinct'] = r
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 divider("7. ETH GROUP ADDRESS (sequential keys, C-level pipeline)")
@@ -293,10 +320,10 @@ divider("9. BLOOM FILTER OPERATIONS")
 print("  Setting up bloom filter with 10,000 entries...")
 num_entries = 10_000
 # Generate some h160 values
-h160_list = []
 test_h160s = ice.privatekey_loop_h160(num_entries, 0, True, TEST_PK)
-for i in range(num_entries):
-    h160_list.append(test_h160s[i*20:(i+1)*20])
+# Fill_in_bloom wants a list of 20-byte entries; the batch APIs below take
+# prefixes of the contiguous test_h160s buffer directly.
+h160_list = [test_h160s[off:off + 20] for off in range(0, num_entries * 20, 20)]
 
 # Fill_in_bloom returns (bits, hashes, filter_bytes, fp, count)
 bloom_bits, bloom_hashes, bloom_filter, _fp, _cnt = ice.Fill_in_bloom(h160_list, 1e-8)
@@ -315,7 +342,7 @@ if r: results['check_in_bloom'] = r
 # Signature: bloom_check_add_mcpu(bigbuff, num_items, sz, mcpu, check_add, bloom_bits, bloom_hashes, bloom_filter)
 # check_add: 0=check, 1=add
 for batch_sz in [1000, 10_000]:
-    bigbuff = b''.join(h160_list[:batch_sz])
+    bigbuff = test_h160s[:batch_sz * 20]
     iters = max(10, 200_000 // batch_sz)
     r = benchmark(f"bloom_check_add_mcpu(check, {batch_sz} items, mcpu={NUM_CPUS})",
         lambda bb=bigbuff, bs=batch_sz: ice.bloom_check_add_mcpu(bb, bs, 20, NUM_CPUS, 0, bloom_bits, bloom_hashes, bloom_filter),
@@ -331,12 +358,10 @@ divider("10. COLLISION CHECKING (requires bin file loaded in RAM)")
 print("  Creating sorted binary h160 file for collision testing...")
 import struct
 
-# Sort the h160 list and write as binary
-sorted_h160 = sorted(h160_list)
+# Sort the h160 list and write as binary in a single write
 bin_file = '/tmp/test_h160.bin'
 with open(bin_file, 'wb') as f:
-    for h in sorted_h160:
-        f.write(h)
+    f.write(b''.join(sorted(h160_list)))
 
 try:
     ice.Load_data_to_memory(bin_file, False)
@@ -351,7 +376,7 @@ try:
 
     # check_collision_mcpu (batch)
     for batch_sz in [1000, 10_000]:
-        bigbuff = b''.join(h160_list[:batch_sz])
+        bigbuff = test_h160s[:batch_sz * 20]
         iters = max(10, 200_000 // batch_sz)
         r = benchmark(f"check_collision_mcpu({batch_sz} items, mcpu={NUM_CPUS})",
             lambda bb=bigbuff, bs=batch_sz: ice.check_collision_mcpu(bb, bs, NUM_CPUS),
@@ -386,11 +411,15 @@ r = benchmark(f"Strategy A-SSE: privatekey_loop_h160_sse({batch_sz})",
 if r: results['strategy_A_SSE_loop_h160'] = r
 
 # Strategy B: point_sequential_increment + pubkey_to_h160 loop
+# Reference-only path: iceland exposes no buffer -> h160 entry point, so the
+# per-point hash stays a Python loop. Strategy A is the C-level equivalent.
 def strategy_b():
     pts = ice.point_sequential_increment(batch_sz, BASE_POINT)
-    # Now hash each point — this is the bottleneck
-    for i in range(batch_sz):
-        ice.pubkey_to_h160(0, True, pts[i*65:(i+1)*65])
+    # Now hash each point — this is the bottleneck. Bind the function once
+    # and step by byte offset to keep per-key interpreter work minimal.
+    to_h160 = ice.pubkey_to_h160
+    for off in range(0, batch_sz * 65, 65):
+        to_h160(0, True, pts[off:off + 65])
 r = benchmark(f"Strategy B: seq_increment({batch_sz}) + pubkey_to_h160 loop",
     strategy_b, 3, batch_sz)
 if r: results['strategy_B_seq_plus_hash'] = r
@@ -425,16 +454,17 @@ r = benchmark(f"Strategy F: loop_h160({batch_sz}) + bloom_check_mcpu [full pipel
     strategy_f, 10, batch_sz)
 if r: results['strategy_F_h160_bloom'] = r
 
-# Strategy G: privatekey_loop_h160 + simple byte comparison (target scan)
+# Strategy G: privatekey_loop_h160 + bytes.find scan (alignment-safe, see BUG-002)
 def strategy_g():
     h160s = ice.privatekey_loop_h160(batch_sz, 0, True, TEST_PK)
-    # Just scan for target h160 in the buffer
-    target = TARGET_H160
-    for i in range(batch_sz):
-        if h160s[i*20:(i+1)*20] == target:
+    # C-level search; skip past any unaligned hit and keep looking
+    idx = h160s.find(TARGET_H160)
+    while idx != -1:
+        if idx % 20 == 0:
             return True
+        idx = h160s.find(TARGET_H160, idx + 1)
     return False
-r = benchmark(f"Strategy G: loop_h160({batch_sz}) + Python byte scan [single target]",
+r = benchmark(f"Strategy G: loop_h160({batch_sz}) + bytes.find scan [single target]",
     strategy_g, 10, batch_sz)
 if r: results['strategy_G_h160_pyscan'] = r
 
@@ -454,6 +484,13 @@ r = benchmark(f"Strategy I: loop_h160_sse({batch_sz}) + Python 'in' bytes search
     strategy_i, 20, batch_sz)
 if r: results['strategy_I_sse_in'] = r
 
+# Search step alone: 'in' over a precomputed buffer. In H/I the h160
+# generation dominates and hides the cost of the search itself.
+h_buf = ice.privatekey_loop_h160(batch_sz, 0, True, TEST_PK)
+r = benchmark(f"Search only: Python 'in' over precomputed {batch_sz} h160s",
+    lambda: TARGET_H160 in h_buf, 1000, batch_sz)
+if r: results['search_in_only'] = r
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 divider("12. LARGE BATCH TESTS (finding optimal batch size)")
@@ -15,6 +15,7 @@
  *      (fastest form of EC point addition, no inversions)
  *   4. Direct secp256k1_eckey_pubkey_serialize33 (no public API overhead)
  *   5. Lock-free atomic counters, fast xorshift PRNG
+ *   6. 8-way AVX2 SHA256 + RIPEMD160 over consecutive points
  *
  * Compile (from secp256k1_src directory):
  *   gcc -O3 -march=native -I/root/secp256k1_src/include -I/root/secp256k1_src/src \
@@ -27,6 +28,12 @@
 /* secp256k1 build config */
 #define SECP256K1_BUILD
 
+/* x86_64 assembly field mul/sqr, as libsecp256k1's own configure selects by
+ * default; this single-TU build would otherwise fall back to int128 C */
+#if defined(__x86_64__) && !defined(USE_ASM_X86_64)
+#define USE_ASM_X86_64 1
+#endif
+
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
@@ -63,7 +70,8 @@
 #include "src/precomputed_ecmult.c"
 #include "src/precomputed_ecmult_gen.c"
 
-/* Custom optimized SHA256 and RIPEMD160 (specialized for 33 and 32 byte inputs) */
+/* Custom optimized SHA256 and RIPEMD160 (specialized for 33 and 32 byte inputs,
+ * 8-way AVX2 when built with -march=native on an AVX2 host) */
 #include "/root/puzzle71/sha256_rmd160_fast.h"
 
 /* ======================== Configuration ======================== */
@@ -83,6 +91,10 @@ static uint32_t TARGET_PREFIX;
 #define NUM_BATCHES    2048
 #define CHUNK_SIZE     ((uint64_t)BATCH_SIZE * NUM_BATCHES)
 
+#if BATCH_SIZE % HASH160_LANES != 0
+#error "BATCH_SIZE must be a multiple of HASH160_LANES"
+#endif
+
 static int NUM_THREADS = 4;
 #define STATS_INTERVAL 10
 
@@ -106,6 +118,11 @@ static inline void hash160(const unsigned char data[33], unsigned char out[20])
     hash160_fast(data, out);
 }
 
+/* hash160 of HASH160_LANES pubkeys at once (8-way AVX2 when available) */
+static inline void hash160_lanes(const unsigned char data[][33], unsigned char out[][20]) {
+    hash160_fast_lanes(data, out);
+}
+
 static uint64_t read_urandom_u64(void) {
     uint64_t val;
     int fd = open("/dev/urandom", O_RDONLY);
@@ -208,8 +225,8 @@ static void *scanner_thread(void *arg) {
         return NULL;
     }
 
-    unsigned char pub33[33];
-    unsigned char h160_buf[20];
+    unsigned char pub33[HASH160_LANES][33];
+    unsigned char h160_buf[HASH160_LANES][20];
 
     xorshift64_t rng;
     rng.s = read_urandom_u64() ^ ((uint64_t)(tid + 1) * 6364136223846793005ULL);
@@ -241,22 +258,25 @@ static void *scanner_thread(void *arg) {
             /* Step 2: Batch convert Jacobian -> Affine (1 field inversion for all!) */
             secp256k1_ge_set_all_gej_var(aff_batch, jac_batch, BATCH_SIZE);
 
-            /* Step 3: Serialize, hash, and check each point */
-            for (int i = 0; i < BATCH_SIZE; i++) {
-                /* Direct serialization to 33-byte compressed pubkey */
-                secp256k1_eckey_pubkey_serialize33(&aff_batch[i], pub33);
-
-                /* Hash160 = RIPEMD160(SHA256(pub33)) */
-                hash160(pub33, h160_buf);
-
-                /* Fast 4-byte prefix check before full compare */
-                if (__builtin_expect(*(uint32_t*)h160_buf == TARGET_PREFIX, 0)) {
-                    if (memcmp(h160_buf, TARGET_H160, 20) == 0) {
-                        uint64_t offset = (uint64_t)batch_num * BATCH_SIZE + i;
-                        uint64_t found_lo = lo + offset;
-                        uint64_t found_hi = hi + (found_lo < lo ? 1 : 0);
-                        report_found(found_hi, found_lo);
-                        goto done;
+            /* Step 3: Serialize, hash, and check points HASH160_LANES at a time */
+            for (int i = 0; i < BATCH_SIZE; i += HASH160_LANES) {
+                /* Direct serialization to 33-byte compressed pubkeys */
+                for (int j = 0; j < HASH160_LANES; j++)
+                    secp256k1_eckey_pubkey_serialize33(&aff_batch[i + j], pub33[j]);
+
+                /* Hash160 = RIPEMD160(SHA256(pub33)), all lanes in lockstep */
+                hash160_lanes(pub33, h160_buf);
+
+                for (int j = 0; j < HASH160_LANES; j++) {
+                    /* Fast 4-byte prefix check before full compare */
+                    if (__builtin_expect(*(uint32_t*)h160_buf[j] == TARGET_PREFIX, 0)) {
+                        if (memcmp(h160_buf[j], TARGET_H160, 20) == 0) {
+                            uint64_t offset = (uint64_t)batch_num * BATCH_SIZE + i + j;
+                            uint64_t found_lo = lo + offset;
+                            uint64_t found_hi = hi + (found_lo < lo ? 1 : 0);
+                            report_found(found_hi, found_lo);
+                            goto done;
+                        }
                     }
                 }
             }
@@ -393,6 +413,28 @@ int main(int argc, char *argv[]) {
                memcmp(gh, expected, 20) == 0 ? "PASSED" : "FAILED");
         if (memcmp(gh, expected, 20) != 0) return 1;
 
+        /* Verify the multi-lane hash path against the scalar one on
+         * distinct points G, 2G, ..., so a lane mix-up can't pass */
+        unsigned char gs_lanes[HASH160_LANES][33], gh_lanes[HASH160_LANES][20];
+        int lanes_ok = 1;
+        secp256k1_gej lane_j[HASH160_LANES];
+        secp256k1_gej_set_ge(&lane_j[0], &g_gen_affine);
+        for (int i = 0; i < HASH160_LANES; i++) {
+            if (i > 0)
+                secp256k1_gej_add_ge_var(&lane_j[i], &lane_j[i-1], &g_gen_affine, NULL);
+            secp256k1_ge lane_a;
+            secp256k1_ge_set_gej_var(&lane_a, &lane_j[i]);
+            secp256k1_eckey_pubkey_serialize33(&lane_a, gs_lanes[i]);
+        }
+        hash160_lanes(gs_lanes, gh_lanes);
+        for (int i = 0; i < HASH160_LANES; i++) {
+            unsigned char want[20];
+            hash160(gs_lanes[i], want);
+            if (memcmp(gh_lanes[i], want, 20) != 0) lanes_ok = 0;
+        }
+        printf("  Hash160 x%d lanes test: %s\n", HASH160_LANES, lanes_ok ? "PASSED" : "FAILED");
+        if (!lanes_ok) return 1;
+
         /* Verify EC addition: 2G == G+G */
         secp256k1_scalar two_s;
         secp256k1_scalar_set_int(&two_s, 2);
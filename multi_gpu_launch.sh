@@ -409,7 +409,7 @@ LOGDIR="${WORKDIR}/logs"
 CHECK_INTERVAL=30
 
 while true; do
-    clear
+    printf '\033[H\033[2J'   # ANSI clear; avoids forking clear(1) every refresh
     echo "================================================================"
     echo "  Bitcoin Puzzle #71 — Multi-GPU Monitor"
     echo "  $(date '+%Y-%m-%d %H:%M:%S')"
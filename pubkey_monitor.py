@@ -33,10 +33,14 @@ import hashlib
 import json
 import os
 import sys
+import threading
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # =============================================================================
 # Constants
@@ -44,6 +48,7 @@ import requests
 
 TARGET_ADDRESS = "1PWo3JeB9jrGwfHDNpdGK54CRas7fsVzXU"
 TARGET_H160 = "f6f5431d25bbf7b12e8add9af5e3475c44a0a5b8"
+TARGET_H160_BYTES = bytes.fromhex(TARGET_H160)
 
 PUBKEY_FOUND_FILE = "/root/puzzle71/PUBKEY_FOUND.txt"
 LOG_FILE = "/root/puzzle71/logs/pubkey_monitor.log"
@@ -54,6 +59,23 @@ SESSION.headers.update({
     "User-Agent": "PubkeyMonitor/1.0",
     "Accept": "application/json",
 })
+# Up to two quick retries (backoff <= 1s) on transient 500/502/503/504,
+# and nothing else: connect errors and read timeouts are not retried, so a
+# hung explorer costs one REQUEST_TIMEOUT and the round-robin moves on.
+# Retry-After is ignored so a server can't stall the monitor, and 429 is
+# left to the checkers, which log it and rotate to the next API.
+_retry = Retry(
+    total=2,
+    connect=0,
+    read=0,
+    other=0,
+    status=2,
+    backoff_factor=0.5,
+    status_forcelist=(500, 502, 503, 504),
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
+SESSION.mount("https://", HTTPAdapter(max_retries=_retry))
 # Timeout for all requests (connect, read) in seconds
 REQUEST_TIMEOUT = 20
 
@@ -64,16 +86,25 @@ REQUEST_TIMEOUT = 20
 def ensure_log_dir():
     os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
 
+# Line-buffered handle kept open for the life of the process. The lock
+# guards the lazy open and the writes: run_other_checkers logs from
+# worker threads.
+_log_fh = None
+_log_lock = threading.Lock()
+
 def log(msg, level="INFO"):
     """Print and write to log file with timestamp."""
+    global _log_fh
     ts = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
     line = f"[{ts}] [{level}] {msg}"
     print(line, flush=True)
-    try:
-        with open(LOG_FILE, "a") as f:
-            f.write(line + "\n")
-    except Exception:
-        pass  # don't crash if log write fails
+    with _log_lock:
+        try:
+            if _log_fh is None:
+                _log_fh = open(LOG_FILE, "a", buffering=1)
+            _log_fh.write(line + "\n")
+        except Exception:
+            pass  # don't crash if log write fails
 
 # =============================================================================
 # Public key extraction helpers
@@ -82,9 +113,7 @@ def log(msg, level="INFO"):
 def hash160(pubkey_bytes):
     """RIPEMD160(SHA256(pubkey))"""
     sha = hashlib.sha256(pubkey_bytes).digest()
-    r = hashlib.new("ripemd160")
-    r.update(sha)
-    return r.hexdigest()
+    return hashlib.new("ripemd160", sha).digest()
 
 def validate_pubkey_for_address(pubkey_hex):
     """
@@ -92,9 +121,7 @@ def validate_pubkey_for_address(pubkey_hex):
     Returns True if the pubkey corresponds to TARGET_ADDRESS.
     """
     try:
-        pubkey_bytes = bytes.fromhex(pubkey_hex)
-        h = hash160(pubkey_bytes)
-        return h.lower() == TARGET_H160.lower()
+        return hash160(bytes.fromhex(pubkey_hex)) == TARGET_H160_BYTES
     except Exception:
         return False
 
@@ -163,26 +190,34 @@ def extract_pubkey_from_witness(witness_list):
 def check_blockchain_info():
     """
     blockchain.info -- check for outgoing transactions.
-    GET https://blockchain.info/rawaddr/<address>
+    GET https://blockchain.info/balance?active=<address>
+    The balance summary is a few bytes; the full tx list is only fetched
+    (GET https://blockchain.info/rawaddr/<address>) once it shows spending.
     Look at txs where our address appears as an input.
     """
     api_name = "blockchain.info"
-    url = f"https://blockchain.info/rawaddr/{TARGET_ADDRESS}?limit=50"
+    url = f"https://blockchain.info/balance?active={TARGET_ADDRESS}"
     try:
         resp = SESSION.get(url, timeout=REQUEST_TIMEOUT)
         if resp.status_code == 429:
             log(f"{api_name}: rate limited (429)", "WARN")
             return False, None, api_name
         resp.raise_for_status()
-        data = resp.json()
-
-        # n_tx = 0 means no transactions at all
-        if data.get("n_tx", 0) == 0 and data.get("total_sent", 0) == 0:
-            return False, None, api_name
+        summary = resp.json().get(TARGET_ADDRESS, {})
+        total_sent = summary.get("total_received", 0) - summary.get("final_balance", 0)
 
         # If total_sent > 0 there has been spending
-        if data.get("total_sent", 0) > 0:
-            log(f"{api_name}: SPENDING DETECTED! total_sent={data['total_sent']}", "ALERT")
+        if total_sent > 0:
+            log(f"{api_name}: SPENDING DETECTED! total_sent={total_sent}", "ALERT")
+            url = f"https://blockchain.info/rawaddr/{TARGET_ADDRESS}?limit=50"
+            try:
+                resp = SESSION.get(url, timeout=REQUEST_TIMEOUT)
+                resp.raise_for_status()
+                data = resp.json()
+            except Exception as e:
+                # The spend is proven; report it so the caller tries all APIs
+                log(f"{api_name}: tx list fetch failed after spend -- {e}", "WARN")
+                return True, None, api_name
             # Scan transactions for our address as input
             for tx in data.get("txs", []):
                 for inp in tx.get("inputs", []):
@@ -214,21 +249,35 @@ def check_blockchain_info():
 def check_blockstream():
     """
     blockstream.info -- check for outgoing transactions via its Esplora API.
-    GET https://blockstream.info/api/address/<address>/txs
+    GET https://blockstream.info/api/address/<address>
+    The address stats are a few hundred bytes; the tx list
+    (GET https://blockstream.info/api/address/<address>/txs) is only
+    fetched once they show a spent output, confirmed or in the mempool.
     """
     api_name = "blockstream.info"
-    url = f"https://blockstream.info/api/address/{TARGET_ADDRESS}/txs"
+    url = f"https://blockstream.info/api/address/{TARGET_ADDRESS}"
     try:
         resp = SESSION.get(url, timeout=REQUEST_TIMEOUT)
         if resp.status_code == 429:
             log(f"{api_name}: rate limited (429)", "WARN")
             return False, None, api_name
         resp.raise_for_status()
-        txs = resp.json()
-
-        if not txs:
+        stats = resp.json()
+        spent = (stats.get("chain_stats", {}).get("spent_txo_count", 0)
+                 + stats.get("mempool_stats", {}).get("spent_txo_count", 0))
+        if spent == 0:
             return False, None, api_name
 
+        log(f"{api_name}: SPENDING DETECTED! spent_txo_count={spent}", "ALERT")
+        try:
+            resp = SESSION.get(f"{url}/txs", timeout=REQUEST_TIMEOUT)
+            resp.raise_for_status()
+            txs = resp.json()
+        except Exception as e:
+            # The spend is proven; report it so the caller tries all APIs
+            log(f"{api_name}: tx list fetch failed after spend -- {e}", "WARN")
+            return True, None, api_name
+
         for tx in txs:
             for vin in tx.get("vin", []):
                 prevout = vin.get("prevout", {})
@@ -247,7 +296,8 @@ def check_blockstream():
                         return True, pubkey, api_name
                     return True, None, api_name
 
-        return False, None, api_name
+        # Spent outputs exist but the spending tx wasn't in the first page
+        return True, None, api_name
 
     except requests.exceptions.RequestException as e:
         log(f"{api_name}: request error -- {e}", "WARN")
@@ -260,17 +310,19 @@ def check_blockstream():
 def check_mempool_space():
     """
     mempool.space -- check confirmed + mempool transactions.
-    Confirmed: GET https://mempool.space/api/address/<address>/txs
-    Mempool:   GET https://mempool.space/api/address/<address>/txs/mempool
+    GET https://mempool.space/api/address/<address>/txs
+    Esplora returns unconfirmed txs ahead of the first confirmed page, so one
+    request covers both (no separate /txs/mempool round-trip).
     """
     api_name = "mempool.space"
 
-    def _scan_txs(txs, label):
+    def _scan_txs(txs):
         for tx in txs:
             for vin in tx.get("vin", []):
                 prevout = vin.get("prevout", {})
                 scriptpubkey_addr = prevout.get("scriptpubkey_address", "")
                 if scriptpubkey_addr == TARGET_ADDRESS:
+                    label = "confirmed" if tx.get("status", {}).get("confirmed") else "mempool"
                     log(f"{api_name}: SPENDING TX ({label})! txid={tx.get('txid', '?')}", "ALERT")
                     scriptsig_hex = vin.get("scriptsig", "")
                     pubkey = extract_pubkey_from_scriptsig(scriptsig_hex)
@@ -284,26 +336,15 @@ def check_mempool_space():
         return False, None
 
     try:
-        # Check mempool (unconfirmed) FIRST -- speed matters
-        url_mempool = f"https://mempool.space/api/address/{TARGET_ADDRESS}/txs/mempool"
-        resp = SESSION.get(url_mempool, timeout=REQUEST_TIMEOUT)
-        if resp.status_code == 200:
-            txs = resp.json()
-            if txs:
-                found, pubkey = _scan_txs(txs, "mempool")
-                if found:
-                    return True, pubkey, api_name
-
-        # Check confirmed transactions
-        url_conf = f"https://mempool.space/api/address/{TARGET_ADDRESS}/txs"
-        resp = SESSION.get(url_conf, timeout=REQUEST_TIMEOUT)
+        url = f"https://mempool.space/api/address/{TARGET_ADDRESS}/txs"
+        resp = SESSION.get(url, timeout=REQUEST_TIMEOUT)
         if resp.status_code == 429:
             log(f"{api_name}: rate limited (429)", "WARN")
             return False, None, api_name
         resp.raise_for_status()
         txs = resp.json()
         if txs:
-            found, pubkey = _scan_txs(txs, "confirmed")
+            found, pubkey = _scan_txs(txs)
             if found:
                 return True, pubkey, api_name
 
@@ -407,6 +448,29 @@ API_CHECKERS = [
     check_blockchair,
 ]
 
+
+def run_other_checkers(skip):
+    """
+    Query every checker except `skip` concurrently and yield each
+    (has_spending_tx, pubkey_hex_or_None, api_name) result as it arrives.
+    The sweep costs one round-trip instead of one per API.
+    """
+    others = [fn for fn in API_CHECKERS if fn is not skip]
+    pool = ThreadPoolExecutor(max_workers=len(others))
+    try:
+        futures = [pool.submit(fn) for fn in others]
+        for fut in as_completed(futures):
+            try:
+                yield fut.result()
+            except Exception:
+                pass
+    finally:
+        # Lets the caller save/alert on the first pubkey without waiting here.
+        # Checkers already in flight still run to completion, and the
+        # interpreter joins them at exit, so process exit can lag by up to
+        # one checker's timeout.
+        pool.shutdown(wait=False, cancel_futures=True)
+
 # =============================================================================
 # Alert on pubkey found
 # =============================================================================
@@ -528,17 +592,11 @@ def run_monitor(interval, webhook_url):
 
                     # Cross-verify with a second API
                     log("Cross-verifying with additional APIs...")
-                    for other_checker in API_CHECKERS:
-                        if other_checker.__name__ == checker.__name__:
-                            continue
-                        try:
-                            has2, pk2, api2 = other_checker()
-                            if has2 and pk2:
-                                log(f"Confirmed by {api2}: {pk2}")
-                            elif has2:
-                                log(f"Spending confirmed by {api2} (pubkey extraction pending)")
-                        except Exception:
-                            pass
+                    for has2, pk2, api2 in run_other_checkers(checker):
+                        if has2 and pk2:
+                            log(f"Confirmed by {api2}: {pk2}")
+                        elif has2:
+                            log(f"Spending confirmed by {api2} (pubkey extraction pending)")
 
                     log("Monitor complete. Public key has been found and saved.")
                     log(f"Run: python /root/puzzle71/kangaroo_launcher.py --pubkey {pubkey_hex}")
@@ -547,19 +605,13 @@ def run_monitor(interval, webhook_url):
                     # Spending detected but pubkey extraction failed
                     # Try all other APIs immediately
                     log("Spending detected but pubkey not extracted -- trying all APIs...", "WARN")
-                    for other_checker in API_CHECKERS:
-                        if other_checker.__name__ == checker.__name__:
-                            continue
-                        try:
-                            has2, pk2, api2 = other_checker()
-                            if pk2:
-                                print_massive_alert(pk2, api2)
-                                save_pubkey(pk2, api2)
-                                trigger_webhook(webhook_url, pk2, api2)
-                                log(f"Run: python /root/puzzle71/kangaroo_launcher.py --pubkey {pk2}")
-                                return pk2
-                        except Exception:
-                            pass
+                    for has2, pk2, api2 in run_other_checkers(checker):
+                        if pk2:
+                            print_massive_alert(pk2, api2)
+                            save_pubkey(pk2, api2)
+                            trigger_webhook(webhook_url, pk2, api2)
+                            log(f"Run: python /root/puzzle71/kangaroo_launcher.py --pubkey {pk2}")
+                            return pk2
                     log("Could not extract pubkey from any API. Will keep trying...", "WARN")
             else:
                 log(f"No spending detected. ({checker.__name__})")
@@ -18,6 +18,7 @@ import time
 import random
 import signal
 import json
+import tempfile
 import multiprocessing as mp
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -79,6 +80,23 @@ def save_found_key(private_key_int):
     print("=" * 70)
 
 
+def write_stats_atomic(stats):
+    """Write stats JSON via temp file + rename so a crash never truncates it."""
+    tmp = None
+    try:
+        fd, tmp = tempfile.mkstemp(dir=str(DATA_DIR), suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(stats, f, indent=2)
+        os.replace(tmp, str(STATS_FILE))
+    except Exception:
+        # Don't leave a stray .tmp behind every SAVE_INTERVAL on failure
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
 def check_batch_sequential(start_key, count):
     """Check a sequential batch of keys. Returns found key or None."""
     target_bytes = bytes.fromhex(TARGET_H160)
@@ -206,7 +224,9 @@ def monitor(total_checked, found, shutdown):
     print(f"{'='*70}\n")
 
     while not shutdown.is_set() and not found.is_set():
-        time.sleep(LOG_INTERVAL)
+        # Wakes immediately on shutdown instead of sleeping out the interval
+        if shutdown.wait(LOG_INTERVAL):
+            break
 
         now = time.time()
         elapsed = now - start_time
@@ -260,14 +280,7 @@ def monitor(total_checked, found, shutdown):
                 "last_update": datetime.now().isoformat(),
                 "probability": current_count / KEYSPACE,
             }
-            try:
-                import tempfile
-                fd, tmp = tempfile.mkstemp(dir=str(DATA_DIR), suffix='.tmp')
-                with os.fdopen(fd, 'w') as f:
-                    json.dump(stats, f, indent=2)
-                os.replace(tmp, str(STATS_FILE))
-            except Exception:
-                pass
+            write_stats_atomic(stats)
             last_save = now
 
     if found.is_set():
@@ -337,11 +350,7 @@ def main():
             "last_update": datetime.now().isoformat(),
             "probability": final_count / KEYSPACE,
         }
-        try:
-            with open(STATS_FILE, 'w') as f:
-                json.dump(stats, f, indent=2)
-        except Exception:
-            pass
+        write_stats_atomic(stats)
 
         sys.exit(0)
 
@@ -173,7 +173,9 @@ def monitor(nworkers):
     print(f"{'='*70}\n", flush=True)
 
     while not shutdown_flag.is_set() and not found_flag.is_set():
-        time.sleep(LOG_INTERVAL)
+        # Wakes immediately on shutdown instead of sleeping out the interval
+        if shutdown_flag.wait(LOG_INTERVAL):
+            break
         now = time.time()
         c = counter.value
         dt = now - last_t